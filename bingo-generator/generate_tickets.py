@@ -6,10 +6,12 @@ Generates British-style bingo tickets with QR codes for the Bingo Game Manager a
 Each ticket has 9 columns x 3 rows with 5 numbers per row and 4 blanks per row.
 """
 
+import concurrent.futures
+import functools
+import itertools
 import random
-import csv
 import struct
-from typing import List, Tuple
+from typing import List, Sequence
 from pathlib import Path
 
 try:
@@ -17,218 +19,365 @@ try:
     from reportlab.lib.units import mm
     from reportlab.pdfgen import canvas
     from reportlab.lib import colors
-    from reportlab.lib.utils import ImageReader
     from reportlab.pdfbase import pdfmetrics
     from reportlab.pdfbase.ttfonts import TTFont
     import qrcode
-    from io import BytesIO
-    from PIL import Image
 except ImportError as e:
     print("Error: Missing required libraries.")
-    print("Please install: pip install reportlab qrcode[pil] pillow")
+    print("Please install: pip install reportlab qrcode")
     raise e
 
+try:
+    import numpy as np
+except ImportError:
+    # Optional: enables batched card generation for large ticket runs
+    np = None
+
 
 # Numbers to exclude from generated tickets (missing from physical set)
 EXCLUDED_NUMBERS = [20, 72]
 
+# Column ranges for British bingo
+COLUMN_RANGES = (
+    (1, 9),    # Column 0: 1-9
+    (10, 19),  # Column 1: 10-19
+    (20, 29),  # Column 2: 20-29
+    (30, 39),  # Column 3: 30-39
+    (40, 49),  # Column 4: 40-49
+    (50, 59),  # Column 5: 50-59
+    (60, 69),  # Column 6: 60-69
+    (70, 79),  # Column 7: 70-79
+    (80, 90),  # Column 8: 80-90
+)
+
+# Candidate numbers per column, with excluded numbers already removed
+COLUMN_POOLS = tuple(
+    tuple(n for n in range(min_val, max_val + 1) if n not in EXCLUDED_NUMBERS)
+    for min_val, max_val in COLUMN_RANGES
+)
+
+# All ways of distributing the 15 numbers over the 9 columns with 1-3 per column
+COLUMN_COUNT_VECTORS = tuple(
+    counts for counts in itertools.product((1, 2, 3), repeat=9) if sum(counts) == 15
+)
+
+# Private RNG: skips the indirection through the random module's global
+# instance on every draw in the generation loop
+_rand = random.Random()
+
+
+class _BitPool:
+    """Serves the generator's many tiny random draws from batched 64-bit words
+
+    One getrandbits(64) call refills the pool, so the per-draw RNG cost is
+    amortized across all the small selections a card needs instead of
+    paying a full RNG call for each.
+    """
+
+    __slots__ = ('bits', 'depth')
+
+    def __init__(self):
+        self.bits = 0
+        self.depth = 0
+
+    def randbelow(self, n: int) -> int:
+        """Uniform int in [0, n), by rejection on the next bit field"""
+        if n <= 1:
+            return 0
+        k = (n - 1).bit_length()
+        while True:
+            if self.depth < k:
+                self.bits = _rand.getrandbits(64)
+                self.depth = 64
+            value = self.bits & ((1 << k) - 1)
+            self.bits >>= k
+            self.depth -= k
+            if value < n:
+                return value
+
+    def sample(self, items: list, k: int) -> list:
+        """Uniform k-subset via partial Fisher-Yates; mutates and returns items"""
+        n = len(items)
+        for i in range(k):
+            j = i + self.randbelow(n - i)
+            items[i], items[j] = items[j], items[i]
+        del items[k:]
+        return items
+
+
+_bits = _BitPool()
+
+if np is not None:
+    # Array versions of the tables above for the batched generator:
+    # column pools padded to equal length, with a mask marking the padding
+    _POOL_WIDTH = max(len(pool) for pool in COLUMN_POOLS)
+    _POOLS_NP = np.zeros((9, _POOL_WIDTH), dtype=np.int8)
+    for _col, _pool in enumerate(COLUMN_POOLS):
+        _POOLS_NP[_col, :len(_pool)] = _pool
+    _POOL_LENS = np.array([len(pool) for pool in COLUMN_POOLS])
+    _POOL_PAD = (np.arange(_POOL_WIDTH)[None, :] >= _POOL_LENS[:, None]) * 2.0
+    _COUNT_VECTORS_NP = np.array(COLUMN_COUNT_VECTORS, dtype=np.int8)
+    # One PCG64 generator for all batches
+    _RNG = np.random.default_rng()
+
+
+def generate_cards(num_cards: int) -> "np.ndarray":
+    """
+    Generate a batch of valid British bingo cards as a (num_cards, 3, 9) array.
+
+    Vectorized equivalent of BritishBingoCard.generate: same count-vector
+    table, row assignment and per-column sampling, but computed for the
+    whole batch in a handful of numpy operations. Requires numpy.
+    """
+    # Pick a count vector per card
+    counts = _COUNT_VECTORS_NP[_RNG.integers(0, len(_COUNT_VECTORS_NP), num_cards)]
+
+    # Assign columns to rows: per row, take the 5 highest-scoring columns.
+    # Forced columns (remaining == rows left) are boosted so they always
+    # win, exhausted columns are sunk so they never do; ties among the
+    # rest are random, i.e. a uniform 5-subset of the eligible columns.
+    row_mask = np.zeros((num_cards, 3, 9), dtype=bool)
+    remaining = counts.copy()
+    for row in range(3):
+        rows_left = 3 - row
+        score = _RNG.random((num_cards, 9))
+        score[remaining == rows_left] += 2.0
+        score[remaining == 0] -= 2.0
+        top5 = np.argpartition(score, -5, axis=1)[:, -5:]
+        np.put_along_axis(row_mask[:, row, :], top5, True, axis=1)
+        remaining -= row_mask[:, row, :]
+
+    # Sample counts[col] numbers per column: random-order the pools for
+    # every card at once, keep the first picks, sort them ascending and
+    # pad the rest with a high sentinel
+    noise = _RNG.random((num_cards, 9, _POOL_WIDTH)) + _POOL_PAD
+    picks = np.argsort(noise, axis=2)[:, :, :3]
+    values = _POOLS_NP[np.arange(9)[None, :, None], picks]
+    values = np.where(np.arange(3)[None, None, :] < counts[:, :, None], values, 127)
+    values.sort(axis=2)
+
+    # Scatter into the grid: the k-th selected row of a column gets the
+    # k-th smallest of that column's numbers
+    ordinal = (np.cumsum(row_mask, axis=1) - 1).clip(min=0)
+    placed = np.take_along_axis(values, ordinal.transpose(0, 2, 1), axis=2)
+    return np.where(row_mask, placed.transpose(0, 2, 1), 0)
+
 
 class BritishBingoCard:
-    """Generates a British-style bingo card (9x3 grid, 5 numbers per row)"""
+    """Generates a British-style bingo card (9x3 grid, 5 numbers per row)
+
+    The grid is stored as a flat row-major 27-byte array: every value
+    fits in a byte, and the flat buffer avoids nested-list pointer
+    chasing and packs straight into the QR payload.
+    """
 
     def __init__(self):
-        self.grid = [[0 for _ in range(9)] for _ in range(3)]
+        self.grid = bytearray(27)
 
-    def generate(self) -> List[List[int]]:
+    def generate(self) -> bytearray:
         """Generate a valid British bingo card"""
-        # Column ranges for British bingo
-        column_ranges = [
-            (1, 9),    # Column 0: 1-9
-            (10, 19),  # Column 1: 10-19
-            (20, 29),  # Column 2: 20-29
-            (30, 39),  # Column 3: 30-39
-            (40, 49),  # Column 4: 40-49
-            (50, 59),  # Column 5: 50-59
-            (60, 69),  # Column 6: 60-69
-            (70, 79),  # Column 7: 70-79
-            (80, 90),  # Column 8: 80-90
-        ]
-
-        # Generate numbers for each column
+        bits = _bits
+
+        # Pick how many numbers each column gets (1-3 each, 15 in total)
+        counts = COLUMN_COUNT_VECTORS[bits.randbelow(len(COLUMN_COUNT_VECTORS))]
+
+        # Assign columns to rows so every row gets exactly 5 numbers.
+        # A column whose remaining numbers equal the remaining rows must
+        # appear in all of them; the rest of the row is drawn from the
+        # other columns that still have numbers left. This can never fail,
+        # so no re-balancing pass is needed.
+        remaining = list(counts)
+        row_columns = []
+        for rows_left in (3, 2, 1):
+            forced = [col for col in range(9) if remaining[col] == rows_left]
+            optional = [col for col in range(9) if 0 < remaining[col] < rows_left]
+            chosen = forced + bits.sample(optional, 5 - len(forced))
+            for col in chosen:
+                remaining[col] -= 1
+            row_columns.append(chosen)
+
+        # Fill each column with sorted numbers, top to bottom
         for col in range(9):
-            min_val, max_val = column_ranges[col]
-            available_numbers = [n for n in range(min_val, max_val + 1) if n not in EXCLUDED_NUMBERS]
-            random.shuffle(available_numbers)
+            numbers = iter(sorted(bits.sample(list(COLUMN_POOLS[col]), counts[col])))
+            for row in range(3):
+                self.grid[row * 9 + col] = next(numbers) if col in row_columns[row] else 0
 
-            # Each column gets 1-3 numbers distributed across rows
-            # We'll use a simple distribution: try to get close to 15 total numbers
-            # with 5 per row
-            num_in_column = min(3, len(available_numbers))
+        return self.grid
 
-            # Select which rows get numbers in this column
-            rows_to_fill = random.sample(range(3), num_in_column)
+    def to_flat_list(self) -> List[int]:
+        """Convert grid to flat list (left to right, top to bottom)"""
+        return list(self.grid)
 
-            for i, row in enumerate(rows_to_fill):
-                self.grid[row][col] = available_numbers[i]
 
-        # Ensure each row has exactly 5 numbers and 4 blanks
-        self._balance_rows()
+# Shared QR encoder (Version 4, Error correction M): the version-4 module
+# matrix and function patterns only depend on these settings, so one
+# instance is built at import and cleared between tickets
+_QR = qrcode.QRCode(
+    version=4,
+    error_correction=qrcode.constants.ERROR_CORRECT_M,
+    box_size=10,
+    border=1,
+)
 
-        # Sort numbers in each column (top to bottom)
-        self._sort_columns()
+# QR payload layout: 2-byte little-endian ticket ID + 27 card bytes
+_QR_STRUCT = struct.Struct('<H27B')
 
-        return self.grid
+# Decimal byte strings for every value the CSV can contain (cell values
+# 0-90 and 4-digit ticket IDs), so rows are emitted by table lookup
+_NUMSTR = [str(i).encode() for i in range(10000)]
 
-    def _balance_rows(self):
-        """Ensure each row has exactly 5 numbers and 4 blanks"""
-        for row_idx in range(3):
-            row = self.grid[row_idx]
-            num_count = sum(1 for cell in row if cell != 0)
-
-            if num_count < 5:
-                # Need to add numbers
-                empty_cols = [i for i, cell in enumerate(row) if cell == 0]
-                cols_to_fill = random.sample(empty_cols, 5 - num_count)
-
-                for col in cols_to_fill:
-                    # Get a number from this column's range
-                    min_val, max_val = self._get_column_range(col)
-                    # Find a number not already used in this column
-                    used_in_col = [self.grid[r][col] for r in range(3)]
-                    available = [n for n in range(min_val, max_val + 1)
-                                if n not in used_in_col and n not in EXCLUDED_NUMBERS]
-                    if available:
-                        self.grid[row_idx][col] = random.choice(available)
-
-            elif num_count > 5:
-                # Need to remove numbers
-                filled_cols = [i for i, cell in enumerate(row) if cell != 0]
-                cols_to_empty = random.sample(filled_cols, num_count - 5)
-
-                for col in cols_to_empty:
-                    self.grid[row_idx][col] = 0
-
-    def _sort_columns(self):
-        """Sort numbers in each column from top to bottom"""
-        for col in range(9):
-            column_values = [self.grid[row][col] for row in range(3) if self.grid[row][col] != 0]
-            column_values.sort()
 
-            value_idx = 0
-            for row in range(3):
-                if self.grid[row][col] != 0:
-                    self.grid[row][col] = column_values[value_idx]
-                    value_idx += 1
-
-    def _get_column_range(self, col: int) -> Tuple[int, int]:
-        """Get the valid number range for a column"""
-        ranges = [
-            (1, 9), (10, 19), (20, 29), (30, 39), (40, 49),
-            (50, 59), (60, 69), (70, 79), (80, 90)
-        ]
-        return ranges[col]
+# Encoding a QR is CPU-bound pure Python, so for large runs the matrices
+# are precomputed in parallel; below this many tickets the worker startup
+# costs more than it saves
+_PARALLEL_QR_THRESHOLD = 200
 
-    def to_flat_list(self) -> List[int]:
-        """Convert grid to flat list (left to right, top to bottom)"""
-        result = []
-        for row in self.grid:
-            result.extend(row)
-        return result
+# Packed payload -> module matrix, shared by the serial and parallel paths
+_qr_matrix_cache = {}
+
+
+def _encode_qr_matrix(payload: bytes) -> List[List[bool]]:
+    """Encode a packed ticket payload into its QR module matrix (with border)"""
+    _QR.clear()
+    _QR.add_data(payload, optimize=0)
+    _QR.make(fit=False)
+    return _QR.get_matrix()
 
 
-def generate_qr_code(ticket_id: int, card_data: List[int]) -> Image:
+def _qr_matrix(payload: bytes) -> List[List[bool]]:
+    """QR module matrix for a packed payload, cached"""
+    matrix = _qr_matrix_cache.get(payload)
+    if matrix is None:
+        matrix = _qr_matrix_cache[payload] = _encode_qr_matrix(payload)
+    return matrix
+
+
+def _precompute_qr_matrices(payloads: List[bytes]):
+    """Fill the QR matrix cache for all payloads, in parallel for large runs"""
+    if len(payloads) < _PARALLEL_QR_THRESHOLD:
+        return
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        matrices = executor.map(_encode_qr_matrix, payloads, chunksize=16)
+        _qr_matrix_cache.update(zip(payloads, matrices))
+
+
+def generate_qr_code(ticket_id: int, card_data: List[int]) -> List[List[bool]]:
     """
-    Generate QR code for a ticket
+    Generate the QR code module matrix for a ticket
 
     Format:
     - First 2 bytes: ticket ID (little endian)
     - Next 27 bytes: card contents (0 = blank)
+
+    Identical tickets reuse the cached matrix.
+    """
+    return _qr_matrix(_QR_STRUCT.pack(ticket_id, *card_data))
+
+
+@functools.lru_cache(maxsize=None)
+def _scaled_layout(scale: float) -> dict:
+    """
+    Scale-derived drawing constants, computed once per run
+
+    Scale is fixed for a whole run, so cell geometry and the width of
+    every possible cell number (1-90) only need to be measured once
+    rather than per ticket.
     """
-    # Pack ticket ID as 2-byte little endian
-    binary_data = struct.pack('<H', ticket_id)
-
-    # Add card data (27 bytes)
-    for value in card_data:
-        binary_data += struct.pack('B', value)
-
-    # Generate QR code (Version 4, Error correction M)
-    qr = qrcode.QRCode(
-        version=4,
-        error_correction=qrcode.constants.ERROR_CORRECT_M,
-        box_size=10,
-        border=1,
-    )
-    qr.add_data(binary_data, optimize=0)
-    qr.make(fit=False)
-
-    img = qr.make_image(fill_color="black", back_color="white")
-    return img
-
-
-def draw_ticket_front(c: canvas.Canvas, card_data: List[int], x: float, y: float,
-                     ticket_id: int, scale: float = 1.0):
-    """Draw a bingo ticket on the PDF (front side with numbers)"""
-    # Calculate dimensions based on scale
-    cell_width = 10 * mm * scale
     cell_height = 12 * mm * scale
     font_size = 14 * scale
-    id_font_size = 8 * scale
-
-    # Draw grid
-    c.setFont("Helvetica-Bold", font_size)
+    return {
+        'cell_width': 10 * mm * scale,
+        'cell_height': cell_height,
+        'font_size': font_size,
+        'id_font_size': 8 * scale,
+        'text_y_offset': (cell_height - 5 * mm * scale) / 2,
+        'id_y_offset': 4 * mm * scale,
+        'qr_size': 30 * mm * scale,
+        'ticket_width': 90 * mm * scale,
+        'ticket_height': 36 * mm * scale,
+        'number_widths': [0.0] + [pdfmetrics.stringWidth(str(n), "Helvetica-Bold", font_size)
+                                  for n in range(1, 91)],
+        # Helvetica digits all have the same advance width, so every
+        # 4-digit ticket ID measures identically
+        'id_width': pdfmetrics.stringWidth('0000', "Helvetica", 8 * scale),
+    }
+
+
+def draw_ticket_front(c: canvas.Canvas, card_data: Sequence[int], x: float, y: float,
+                     scale: float = 1.0):
+    """Draw a bingo ticket grid on the PDF (front side with numbers)
+
+    The caller sets the number font (and draws the ticket ID) so a page
+    of tickets needs only one font switch per text style.
+    """
+    layout = _scaled_layout(scale)
+    cell_width = layout['cell_width']
+    cell_height = layout['cell_height']
+    number_widths = layout['number_widths']
+    text_y_offset = layout['text_y_offset']
+
+    # Cell corner coordinates, computed once per ticket instead of per cell
+    cell_xs = [x + col * cell_width for col in range(9)]
+    cell_ys = [y + (2 - row) * cell_height for row in range(3)]
+
+    # Draw the grid as 4 horizontal + 10 vertical lines in one stroked
+    # path — the same borders as 27 rects in half the operators
+    grid_right = x + 9 * cell_width
+    grid_top = y + 3 * cell_height
+    borders = c.beginPath()
+    for row in range(4):
+        line_y = y + row * cell_height
+        borders.moveTo(x, line_y)
+        borders.lineTo(grid_right, line_y)
+    for col in range(10):
+        line_x = x + col * cell_width
+        borders.moveTo(line_x, y)
+        borders.lineTo(line_x, grid_top)
+    c.drawPath(borders, stroke=1, fill=0)
+
+    # Draw the numbers
+    draw_string = c.drawString
     for row in range(3):
+        text_y = cell_ys[row] + text_y_offset
         for col in range(9):
-            cell_x = x + col * cell_width
-            cell_y = y + (2 - row) * cell_height
+            # Draw number if not blank, centered in the cell
+            value = card_data[row * 9 + col]
+            if value != 0:
+                text_x = cell_xs[col] + (cell_width - number_widths[value]) / 2
+                draw_string(text_x, text_y, str(value))
 
-            # Draw cell border
-            c.rect(cell_x, cell_y, cell_width, cell_height)
 
-            # Draw number if not blank
-            idx = row * 9 + col
-            if card_data[idx] != 0:
-                # Center the number in the cell
-                num_str = str(card_data[idx])
-                text_width = c.stringWidth(num_str, "Helvetica-Bold", font_size)
-                text_x = cell_x + (cell_width - text_width) / 2
-                text_y = cell_y + (cell_height - 5*mm*scale) / 2
-                c.drawString(text_x, text_y, num_str)
-
-    # Draw 4-digit ticket ID on bottom left
-    c.setFont("Helvetica", id_font_size)
-    id_str = f"{ticket_id:04d}"
-    c.drawString(x, y - 4*mm*scale, id_str)
-
-
-def draw_ticket_back(c: canvas.Canvas, ticket_id: int, card_data: List[int],
+def draw_ticket_back(c: canvas.Canvas, ticket_id: int, payload: bytes,
                     x: float, y: float, scale: float = 1.0):
-    """Draw the back of a ticket with QR code centered in the same space as front ticket"""
-    # Calculate dimensions based on scale
-    qr_size = 30 * mm * scale
-    ticket_width = 90 * mm * scale
-    ticket_height = 36 * mm * scale  # Same height as front ticket grid
-    id_font_size = 8 * scale
+    """Draw the back of a ticket with QR code centered in the same space as front ticket
 
-    # Generate QR code
-    qr_img = generate_qr_code(ticket_id, card_data)
+    The payload is the packed 29-byte QR content built at generation time.
+    """
+    layout = _scaled_layout(scale)
+    qr_size = layout['qr_size']
+    ticket_width = layout['ticket_width']
+    ticket_height = layout['ticket_height']  # Same height as front ticket grid
 
-    # Save QR code to bytes
-    img_buffer = BytesIO()
-    qr_img.save(img_buffer, format='PNG')
-    img_buffer.seek(0)
+    # QR module matrix (cached per payload). The caller sets the ID font.
+    matrix = _qr_matrix(payload)
+    module_size = qr_size / len(matrix)
 
     # Center QR code horizontally and vertically in ticket area
     qr_x = x + (ticket_width - qr_size) / 2
     qr_y = y + (ticket_height - qr_size) / 2
 
-    # Draw QR code using ImageReader
-    c.drawImage(ImageReader(img_buffer), qr_x, qr_y, width=qr_size, height=qr_size)
+    # Draw the dark modules as a single filled vector path (no raster round-trip)
+    p = c.beginPath()
+    for row_idx, matrix_row in enumerate(matrix):
+        module_y = qr_y + (len(matrix) - 1 - row_idx) * module_size
+        for col_idx, dark in enumerate(matrix_row):
+            if dark:
+                p.rect(qr_x + col_idx * module_size, module_y, module_size, module_size)
+    c.drawPath(p, stroke=0, fill=1)
 
     # Add 4-digit ticket ID below QR code
-    c.setFont("Helvetica", id_font_size)
-    id_str = f"{ticket_id:04d}"
-    text_width = c.stringWidth(id_str, "Helvetica", id_font_size)
-    c.drawString(x + (ticket_width - text_width) / 2, qr_y - 4*mm*scale, id_str)
+    c.drawString(x + (ticket_width - layout['id_width']) / 2,
+                 qr_y - layout['id_y_offset'], f"{ticket_id:04d}")
 
 
 def generate_tickets_pdf(num_tickets: int, output_pdf: str = "bingo_tickets.pdf",
@@ -246,17 +395,29 @@ def generate_tickets_pdf(num_tickets: int, output_pdf: str = "bingo_tickets.pdf"
         title_font: Font name for the title (default: Christmas Merryland)
     """
     # Generate random unique 4-digit ticket IDs
-    all_ids = list(range(1000, 10000))
-    random.shuffle(all_ids)
-    ticket_ids = all_ids[:num_tickets]
-
-    # Generate all tickets
-    tickets = []
-    for ticket_id in ticket_ids:
+    ticket_ids = _rand.sample(range(1000, 10000), num_tickets)
+
+    # Generate all tickets (batched with numpy when available). Each
+    # ticket is kept only as its packed 29-byte payload: the QR content,
+    # the card bytes for drawing (payload[2:]) and the CSV row source are
+    # all the same buffer, so no per-ticket list of boxed ints survives
+    # generation.
+    if np is not None:
+        flat_cards = generate_cards(num_tickets).reshape(num_tickets, 27)
+        payloads = [_QR_STRUCT.pack(ticket_id, *card)
+                    for ticket_id, card in zip(ticket_ids, flat_cards.tolist())]
+    else:
+        # generate() overwrites every cell, so one card instance can be
+        # reused for the whole run
         card = BritishBingoCard()
-        card.generate()
-        card_data = card.to_flat_list()
-        tickets.append((ticket_id, card_data))
+        payloads = []
+        for ticket_id in ticket_ids:
+            card.generate()
+            payloads.append(_QR_STRUCT.pack(ticket_id, *card.grid))
+
+    # Pre-encode the QR matrices (parallel across cores for large runs);
+    # the drawing pass below then only hits the cache
+    _precompute_qr_matrices(payloads)
 
     # Register custom fonts
     script_dir = Path(__file__).parent
@@ -264,8 +425,9 @@ def generate_tickets_pdf(num_tickets: int, output_pdf: str = "bingo_tickets.pdf"
     if christmas_font_path.exists():
         pdfmetrics.registerFont(TTFont('Christmas Merryland', str(christmas_font_path)))
 
-    # Create PDF
-    c = canvas.Canvas(output_pdf, pagesize=A4)
+    # Create PDF (compressed content streams; the vector QR paths are
+    # repetitive operator runs that zlib shrinks by an order of magnitude)
+    c = canvas.Canvas(output_pdf, pagesize=A4, pageCompression=1)
     page_width, page_height = A4
 
     # ===== STANDARD PAGE LAYOUT =====
@@ -300,24 +462,30 @@ def generate_tickets_pdf(num_tickets: int, output_pdf: str = "bingo_tickets.pdf"
     title_y_position = page_height - 20 * mm
 
     # Calculate ticket dimensions
-    ticket_width = 90 * mm * scale
-    ticket_content_height = 36 * mm * scale  # Height of the actual bingo grid
+    layout = _scaled_layout(scale)
+    ticket_width = layout['ticket_width']
+    ticket_content_height = layout['ticket_height']  # Height of the actual bingo grid
     margin_left = (page_width - ticket_width) / 2
 
-    # Generate pages
+    # Resolve the title font and center position once (identical on every page)
+    if title:
+        try:
+            c.setFont(title_font, 18)
+        except KeyError:
+            # Fallback to Helvetica if font not found
+            title_font = 'Helvetica-Bold'
+        title_x = (page_width - c.stringWidth(title, title_font, 18)) / 2
+
+    # Generate pages (one slice of 3 tickets at a time)
     for page_start in range(0, num_tickets, 3):
-        tickets_on_page = tickets[page_start:page_start + 3]
+        page_ids = ticket_ids[page_start:page_start + 3]
+        page_payloads = payloads[page_start:page_start + 3]
 
         # Draw front side
         if title:
             # Draw title at top of page
-            try:
-                c.setFont(title_font, 18)
-            except KeyError:
-                # Fallback to Helvetica if font not found
-                c.setFont('Helvetica-Bold', 18)
-            title_width = c.stringWidth(title, title_font if title_font in pdfmetrics.getRegisteredFontNames() else 'Helvetica-Bold', 18)
-            c.drawString((page_width - title_width) / 2, title_y_position, title)
+            c.setFont(title_font, 18)
+            c.drawString(title_x, title_y_position, title)
 
         # Draw cutting lines (dashed)
         c.setDash(3, 3)
@@ -325,11 +493,19 @@ def generate_tickets_pdf(num_tickets: int, output_pdf: str = "bingo_tickets.pdf"
             c.line(20*mm, cut_y, page_width - 20*mm, cut_y)
         c.setDash()  # Reset to solid line
 
-        for idx, (ticket_id, card_data) in enumerate(tickets_on_page):
+        # Ticket grids and numbers (one font switch for the whole page)
+        c.setFont("Helvetica-Bold", layout['font_size'])
+        for idx, payload in enumerate(page_payloads):
             # Calculate y position so ticket is centered at ticket_center_positions[idx]
             # The draw function expects the bottom y coordinate of the ticket
             ticket_y = ticket_center_positions[idx] - (ticket_content_height / 2)
-            draw_ticket_front(c, card_data, margin_left, ticket_y, ticket_id, scale)
+            draw_ticket_front(c, payload[2:], margin_left, ticket_y, scale)
+
+        # Ticket IDs on the bottom left of each ticket
+        c.setFont("Helvetica", layout['id_font_size'])
+        for idx, ticket_id in enumerate(page_ids):
+            ticket_y = ticket_center_positions[idx] - (ticket_content_height / 2)
+            c.drawString(margin_left, ticket_y - layout['id_y_offset'], f"{ticket_id:04d}")
 
         c.showPage()
 
@@ -340,29 +516,25 @@ def generate_tickets_pdf(num_tickets: int, output_pdf: str = "bingo_tickets.pdf"
             c.line(20*mm, cut_y, page_width - 20*mm, cut_y)
         c.setDash()  # Reset to solid line
 
-        for idx, (ticket_id, card_data) in enumerate(reversed(tickets_on_page)):
+        c.setFont("Helvetica", layout['id_font_size'])
+        for reverse_idx in range(len(page_ids) - 1, -1, -1):
             # Use same center positions (reversed order for duplex printing)
-            reverse_idx = len(tickets_on_page) - 1 - idx
             ticket_y = ticket_center_positions[reverse_idx] - (ticket_content_height / 2)
-            draw_ticket_back(c, ticket_id, card_data, margin_left, ticket_y, scale)
+            draw_ticket_back(c, page_ids[reverse_idx], page_payloads[reverse_idx],
+                             margin_left, ticket_y, scale)
 
         c.showPage()
 
     c.save()
     print(f"Generated PDF: {output_pdf}")
 
-    # Create CSV
-    with open(output_csv, 'w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-
-        # Header
-        header = ['id'] + [f'cell_{i}' for i in range(27)]
-        writer.writerow(header)
-
-        # Data
-        for ticket_id, card_data in tickets:
-            row = [ticket_id] + card_data
-            writer.writerow(row)
+    # Create CSV; every field is a plain integer, so rows are joined from
+    # the precomputed decimal strings with no csv-dialect machinery
+    with open(output_csv, 'wb', buffering=1 << 20) as csvfile:
+        csvfile.write(b'id,' + b','.join(f'cell_{i}'.encode() for i in range(27)) + b'\n')
+        csvfile.writelines(
+            _NUMSTR[ticket_id] + b',' + b','.join(_NUMSTR[v] for v in payload[2:]) + b'\n'
+            for ticket_id, payload in zip(ticket_ids, payloads))
 
     print(f"Generated CSV: {output_csv}")
     print(f"Total tickets generated: {num_tickets}")